@@ -3,10 +3,28 @@ Configuration module for VoiceBox project.
 This module manages all configuration settings including paths, model settings, and system prompts.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
 
+@lru_cache(maxsize=1)
+def _read_system_prompt(path: Path, mtime_ns: int) -> str:
+    """
+    Read the system prompt file.
+    The modification time is part of the cache key, so edits are picked up.
+    
+    Args:
+        path: Path to the system prompt file.
+        mtime_ns: Modification time of the file in nanoseconds.
+    
+    Returns:
+        str: The stripped file contents.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        return file.read().strip()
+
+
 class Config:
     """
     Configuration class for VoiceBox project.
@@ -36,6 +54,7 @@ class Config:
     TTS_SPEED: float = 1.0  # Speech speed (adjustable)
     TTS_DEVICE: str = "auto"  # Device: 'auto', 'cpu', 'cuda', 'cuda:0', 'mps'
     TTS_SAMPLE_RATE: int = 44100  # MeloTTS sample rate
+    TTS_WARMUP: bool = True  # Run a throwaway synthesis at startup when on CUDA
     
     # STT settings
     STT_MODEL_SIZE: str = "small"
@@ -65,18 +84,22 @@ class Config:
     RAG_CHUNK_OVERLAP: int = 50  # Overlap between chunks in characters
     RAG_FAISS_INDEX_TYPE: str = "IVF"  # FAISS index type: 'Flat' (exact), 'IVF', 'HNSW'
     RAG_SIMILARITY_METRIC: str = "dot"  # Similarity metric: 'cosine', 'euclidean', 'dot'
+    RAG_IVF_MIN_VECTORS: int = 10000  # Corpus size at which the 'IVF' index type replaces exact Flat search
+    RAG_IVF_NPROBE: int = 8  # Number of IVF clusters scanned per query
+    RAG_QUERY_CACHE_SIZE: int = 256  # Number of query embeddings kept in the LRU cache
     
     @classmethod
     def load_system_prompt(cls) -> str:
         """
         Load system prompt from file.
+        The file is only re-read when its modification time changes.
         
         Returns:
             str: The system prompt text.
         """
         try:
-            with open(cls.SYSTEM_PROMPT_PATH, 'r', encoding='utf-8') as file:
-                return file.read().strip()
+            path: Path = cls.SYSTEM_PROMPT_PATH
+            return _read_system_prompt(path, path.stat().st_mtime_ns)
         except FileNotFoundError:
             default_prompt: str = (
                 "You are a interactive talkbot which will be conversing with people in day to day life. "
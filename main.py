@@ -191,7 +191,7 @@ class VoiceBoxController:
             # Transcribe audio to text
             logger.info("Transcribing audio to text")
             transcribed_text, stt_info = self._stt.transcribe_audio(audio_file_path)
-            logger.debug(f"STT info: {stt_info}")
+            logger.debug("STT info: %s", stt_info)
             
             if transcribed_text is None:
                 logger.error("Failed to transcribe audio")
@@ -301,7 +301,7 @@ class VoiceBoxController:
             
             for cmd in recorders:
                 try:
-                    logger.debug(f"Trying recorder: {cmd[0]}")
+                    logger.debug("Trying recorder: %s", cmd[0])
                     result = subprocess.run(
                         cmd,
                         stdout=subprocess.DEVNULL,
@@ -315,7 +315,7 @@ class VoiceBoxController:
                         return temp_path
                         
                 except (FileNotFoundError, subprocess.CalledProcessError) as e:
-                    logger.debug(f"Recorder {cmd[0]} failed: {e}")
+                    logger.debug("Recorder %s failed: %s", cmd[0], e)
                     continue
             
             logger.error("No recording tool found")
@@ -4,7 +4,7 @@ Manages conversation history, JSON logging, and timestamps.
 """
 
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
 from datetime import datetime
 from pathlib import Path
 import sys
@@ -106,6 +106,24 @@ class ConversationManager:
         
         self._session_log.append(interaction)
     
+    def write_conversation(self, buffer: TextIO) -> None:
+        """
+        Write conversation history and logs as JSON to a text stream.
+        
+        Args:
+            buffer: Writable text stream (open file, io.StringIO, ...).
+        """
+        session_data: Dict[str, Any] = {
+            'session_id': self._session_id,
+            'session_start': self._session_start.isoformat(),
+            'session_end': datetime.now().isoformat(),
+            'total_interactions': len(self._session_log),
+            'conversation_history': self._conversation_history,
+            'interaction_log': self._session_log
+        }
+        
+        json.dump(session_data, buffer, indent=2, ensure_ascii=False)
+    
     def save_conversation(self, filename: Optional[str] = None) -> Path:
         """
         Save conversation history and logs to JSON file.
@@ -122,17 +140,8 @@ class ConversationManager:
         output_path: Path = Config.CONVERSATIONS_DIR / filename
         
         logger.debug(f"Saving conversation to {output_path}")
-        session_data: Dict[str, Any] = {
-            'session_id': self._session_id,
-            'session_start': self._session_start.isoformat(),
-            'session_end': datetime.now().isoformat(),
-            'total_interactions': len(self._session_log),
-            'conversation_history': self._conversation_history,
-            'interaction_log': self._session_log
-        }
-        
         with open(output_path, 'w', encoding='utf-8') as file:
-            json.dump(session_data, file, indent=2, ensure_ascii=False)
+            self.write_conversation(file)
         
         logger.info(f"Conversation saved: {output_path} ({len(self._session_log)} interactions)")
         print(f"Conversation saved to: {output_path}")
@@ -19,6 +19,51 @@ suppress_library_warnings()
 logger = get_logger('llm')
 
 
+def _generate(
+    client: Any,
+    model: str,
+    system_prompt: str,
+    user_input: str,
+    conversation_history: Optional[List[Dict[str, str]]] = None,
+    options: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Generate a single chat response without touching any handler state.
+    
+    Args:
+        client: Ollama client or module exposing chat().
+        model: Model name.
+        system_prompt: Full system prompt, including any RAG context.
+        user_input: The user's input text.
+        conversation_history: Optional conversation history for context.
+        options: Optional generation options passed to Ollama.
+    
+    Returns:
+        str: The generated response text, stripped.
+    """
+    # Build messages
+    messages: list[Dict[str, str]] = [
+        {'role': 'system', 'content': system_prompt}
+    ]
+    
+    # Add conversation history if provided
+    if conversation_history:
+        messages.extend(conversation_history)
+    
+    # Add current user input
+    messages.append({'role': 'user', 'content': user_input})
+    
+    # Generate response
+    response: Dict[str, Any] = client.chat(
+        model=model,
+        messages=messages,
+        options=options or {}
+    )
+    
+    # Extract response text
+    return response['message']['content'].strip()
+
+
 class LLMHandler:
     """
     Singleton class for handling LLM operations with Ollama.
@@ -27,7 +72,7 @@ class LLMHandler:
     
     _instance: Optional['LLMHandler'] = None
     
-    def __new__(cls) -> 'LLMHandler':
+    def __new__(cls, *args: Any, **kwargs: Any) -> 'LLMHandler':
         """
         Implement singleton pattern.
         
@@ -39,14 +84,19 @@ class LLMHandler:
             cls._instance._initialized = False
         return cls._instance
     
-    def __init__(self) -> None:
+    def __init__(self, ollama_client: Any = None, skip_model_check: bool = False) -> None:
         """
         Initialize LLM handler.
         Only runs once due to singleton pattern.
+        
+        Args:
+            ollama_client: Optional Ollama client exposing list() and chat(). Defaults to the ollama module.
+            skip_model_check: Skip querying Ollama for the configured model at startup.
         """
         if self._initialized:
             return
         
+        self._client = ollama_client if ollama_client is not None else ollama
         self._model_name: str = Config.LLM_MODEL
         self._system_prompt: str = Config.load_system_prompt()
         self._max_length: int = Config.MAX_RESPONSE_LENGTH
@@ -55,7 +105,8 @@ class LLMHandler:
         self._initialized = True
         
         # Verify model is available
-        self._verify_model()
+        if not skip_model_check:
+            self._verify_model()
         
         # Initialize RAG handler
         self._init_rag()
@@ -91,7 +142,7 @@ class LLMHandler:
         Verify that the specified model is available in Ollama.
         """
         try:
-            response = ollama.list()
+            response = self._client.list()
             available_models: list[str] = [model.model for model in response.models]
             
             logger.info(f"Checking for model: {self._model_name}")
@@ -149,32 +200,19 @@ CRITICAL INSTRUCTIONS:
 - Keep responses brief, conversational, and easy to speak aloud
 """
             
-            # Build messages
-            messages: list[Dict[str, str]] = [
-                {'role': 'system', 'content': system_prompt}
-            ]
-            
-            # Add conversation history if provided
-            if conversation_history:
-                messages.extend(conversation_history)
-            
-            # Add current user input
-            messages.append({'role': 'user', 'content': user_input})
-            
-            # Generate response
-            response: Dict[str, Any] = ollama.chat(
-                model=self._model_name,
-                messages=messages,
+            response_text: str = _generate(
+                self._client,
+                self._model_name,
+                system_prompt,
+                user_input,
+                conversation_history,
                 options={
                     'temperature': self._temperature,
                     'num_predict': self._max_length
                 }
             )
-            
-            # Extract response text
-            response_text: str = response['message']['content']
             logger.debug(f"Generated response ({len(response_text)} chars)")
-            return response_text.strip()
+            return response_text
             
         except Exception as e:
             error_message: str = f"Error generating LLM response: {e}"
@@ -3,7 +3,8 @@ Pronunciation Dictionary module for VoiceBox project.
 Maps difficult or mispronounced words to phonetically correct alternatives.
 """
 
-from typing import Dict, Optional
+import re
+from typing import Dict, Optional, Pattern, Tuple
 
 
 class PronunciationDict:
@@ -70,6 +71,27 @@ class PronunciationDict:
         'cybercentric': 'cyber-centric',
     }
     
+    # Alternation of all words, rebuilt whenever the map's words change
+    # (including direct edits to PRONUNCIATION_MAP)
+    _pattern: Optional[Pattern[str]] = None
+    _pattern_words: Tuple[str, ...] = ()
+    
+    @classmethod
+    def _get_pattern(cls) -> Pattern[str]:
+        """
+        Get the compiled alternation matching any word in the dictionary.
+        Longer words come first so e.g. 'MeloTTS' wins over 'TTS'.
+        
+        Returns:
+            Pattern[str]: The compiled pattern.
+        """
+        words: Tuple[str, ...] = tuple(cls.PRONUNCIATION_MAP)
+        if cls._pattern is None or words != cls._pattern_words:
+            ordered = sorted(words, key=len, reverse=True)
+            cls._pattern = re.compile('|'.join(map(re.escape, ordered)))
+            cls._pattern_words = words
+        return cls._pattern
+    
     @classmethod
     def replace_words(cls, text: str) -> str:
         """
@@ -81,13 +103,14 @@ class PronunciationDict:
         Returns:
             str: Text with replacements applied.
         """
-        result = text
+        if not cls.PRONUNCIATION_MAP:
+            return text
         
-        # Apply all replacements
-        for original, replacement in cls.PRONUNCIATION_MAP.items():
-            result = result.replace(original, replacement)
-        
-        return result
+        # Apply all replacements in one pass over the text
+        return cls._get_pattern().sub(
+            lambda match: cls.PRONUNCIATION_MAP.get(match.group(), match.group()),
+            text
+        )
     
     @classmethod
     def add_word(cls, original: str, replacement: str) -> None:
@@ -129,6 +152,16 @@ class PronunciationDict:
         """
         return cls.PRONUNCIATION_MAP.get(word)
     
+    @classmethod
+    def snapshot(cls) -> Tuple[Tuple[str, str], ...]:
+        """
+        Get a hashable snapshot of the dictionary's current contents.
+        
+        Returns:
+            Tuple[Tuple[str, str], ...]: The (original, replacement) pairs.
+        """
+        return tuple(cls.PRONUNCIATION_MAP.items())
+    
     @classmethod
     def list_words(cls) -> Dict[str, str]:
         """
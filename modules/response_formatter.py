@@ -3,8 +3,10 @@ Response Formatter module for VoiceBox project.
 Formats LLM responses to be suitable for TTS output.
 """
 
+import functools
 import re
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Pattern, Tuple
 import sys
 from pathlib import Path
 
@@ -12,6 +14,14 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 from modules.pronunciation_dict import PronunciationDict
 
+# Patterns used outside the rule tables, compiled once at import
+_REPEATED_PUNCTUATION_RE: Pattern[str] = re.compile(r'([.!?])+')
+_PUNCTUATION_SPACING_RE: Pattern[str] = re.compile(r'([.!?,;:])(\S)')
+SENTENCE_SPLIT_RE: Pattern[str] = re.compile(r'(?<=[.!?])\s+')
+_CITATION_NUMBER_RE: Pattern[str] = re.compile(r'\[\d+\]')
+_CITATION_SOURCE_RE: Pattern[str] = re.compile(r'\([Ss]ource:[^()\n]*\)')
+_CITATION_REF_RE: Pattern[str] = re.compile(r'\([Rr]ef:[^()\n]*\)')
+
 
 class ResponseFormatter:
     """
@@ -21,30 +31,50 @@ class ResponseFormatter:
     
     # Formatting rules as data structures
     REMOVAL_PATTERNS: List[Dict[str, Any]] = [
-        {'pattern': r'\*\*(.+?)\*\*', 'replacement': r'\1', 'description': 'Remove bold markdown'},
-        {'pattern': r'\*(.+?)\*', 'replacement': r'\1', 'description': 'Remove italic markdown'},
-        {'pattern': r'`(.+?)`', 'replacement': r'\1', 'description': 'Remove inline code markers'},
+        {'pattern': r'\*\*([^*]+)\*\*', 'replacement': r'\1', 'description': 'Remove bold markdown'},
+        {'pattern': r'\*([^*\n]+)\*', 'replacement': r'\1', 'description': 'Remove italic markdown'},
+        {'pattern': r'`([^`\n]+)`', 'replacement': r'\1', 'description': 'Remove inline code markers'},
         {'pattern': r'```[\s\S]*?```', 'replacement': '', 'description': 'Remove code blocks'},
-        {'pattern': r'\[(.+?)\]\(.+?\)', 'replacement': r'\1', 'description': 'Convert markdown links to text'},
-        {'pattern': r'#+\s+', 'replacement': '', 'description': 'Remove markdown headers'},
-        {'pattern': r'^\s*[-*+]\s+', 'replacement': '', 'description': 'Remove bullet points'},
-        {'pattern': r'^\s*\d+\.\s+', 'replacement': '', 'description': 'Remove numbered lists'},
+        {'pattern': r'\[([^\[\]\n]{1,200})\]\((?:[^()\n]|\([^()\n]{0,200}\)){1,500}\)', 'replacement': r'\1', 'description': 'Convert markdown links to text'},
+        {'pattern': r'^#{1,6}\s+', 'replacement': '', 'description': 'Remove markdown headers'},
+        {'pattern': r'^[ \t]*[-*+]\s+', 'replacement': '', 'description': 'Remove bullet points'},
+        {'pattern': r'^[ \t]*\d+\.\s+', 'replacement': '', 'description': 'Remove numbered lists'},
     ]
     
     REPLACEMENT_PATTERNS: List[Dict[str, Any]] = [
-        {'pattern': r'\n+', 'replacement': ' ', 'description': 'Replace newlines with spaces'},
-        {'pattern': r'\s+', 'replacement': ' ', 'description': 'Collapse multiple spaces'},
-        {'pattern': r'&', 'replacement': 'and', 'description': 'Replace ampersand'},
-        {'pattern': r'%', 'replacement': ' percent', 'description': 'Replace percent symbol'},
-        {'pattern': r'\$', 'replacement': 'dollars', 'description': 'Replace dollar sign'},
-        {'pattern': r'@', 'replacement': 'at', 'description': 'Replace at symbol'},
+        {'pattern': r'\s+', 'replacement': ' ', 'description': 'Collapse whitespace and newlines'},
+    ]
+    
+    # Symbols spoken as words, replaced together in a single pass
+    SYMBOL_REPLACEMENTS: Dict[str, str] = {
+        '&': 'and',
+        '%': ' percent',
+        '$': 'dollars',
+        '@': 'at',
+    }
+    
+    # Rule tables compiled once at class definition
+    _COMPILED_REMOVALS: List[Tuple[Pattern[str], str]] = [
+        (re.compile(rule['pattern'], re.MULTILINE), rule['replacement'])
+        for rule in REMOVAL_PATTERNS
+    ]
+    _COMPILED_REPLACEMENTS: List[Tuple[Pattern[str], str]] = [
+        (re.compile(rule['pattern']), rule['replacement'])
+        for rule in REPLACEMENT_PATTERNS
     ]
+    _SYMBOL_RE: Pattern[str] = re.compile('|'.join(map(re.escape, SYMBOL_REPLACEMENTS)))
+    
+    # Number of formatted responses kept in the LRU cache
+    CACHE_SIZE: int = 128
     
     def __init__(self) -> None:
         """
         Initialize the response formatter.
         """
-        pass
+        # Repeated responses (greetings, error messages) skip the regex pipeline
+        self._format_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._format_uncached
+        )
     
     def format_for_speech(self, text: str) -> str:
         """
@@ -59,21 +89,18 @@ class ResponseFormatter:
         formatted_text: str = text
         
         # Apply removal patterns
-        for rule in self.REMOVAL_PATTERNS:
-            formatted_text = re.sub(
-                rule['pattern'],
-                rule['replacement'],
-                formatted_text,
-                flags=re.MULTILINE
-            )
+        for pattern, replacement in self._COMPILED_REMOVALS:
+            formatted_text = pattern.sub(replacement, formatted_text)
         
         # Apply replacement patterns
-        for rule in self.REPLACEMENT_PATTERNS:
-            formatted_text = re.sub(
-                rule['pattern'],
-                rule['replacement'],
-                formatted_text
-            )
+        for pattern, replacement in self._COMPILED_REPLACEMENTS:
+            formatted_text = pattern.sub(replacement, formatted_text)
+        
+        # Speak symbols as words
+        formatted_text = self._SYMBOL_RE.sub(
+            lambda match: self.SYMBOL_REPLACEMENTS[match.group()],
+            formatted_text
+        )
         
         # Clean up the text
         formatted_text = self._clean_text(formatted_text)
@@ -97,10 +124,10 @@ class ResponseFormatter:
         text = text.strip()
         
         # Remove multiple punctuation
-        text = re.sub(r'([.!?])+', r'\1', text)
+        text = _REPEATED_PUNCTUATION_RE.sub(r'\1', text)
         
         # Ensure proper spacing after punctuation
-        text = re.sub(r'([.!?,;:])(\S)', r'\1 \2', text)
+        text = _PUNCTUATION_SPACING_RE.sub(r'\1 \2', text)
         
         # Remove parenthetical content that might not sound good
         # (Keep this commented out as some parenthetical might be important)
@@ -120,7 +147,7 @@ class ResponseFormatter:
             str: Limited text.
         """
         # Split by sentence endings
-        sentences: List[str] = re.split(r'(?<=[.!?])\s+', text)
+        sentences: List[str] = SENTENCE_SPLIT_RE.split(text)
         
         # Take only first max_sentences
         limited_sentences: List[str] = sentences[:max_sentences]
@@ -138,11 +165,11 @@ class ResponseFormatter:
             str: Text without citations.
         """
         # Remove [1], [2], etc.
-        text = re.sub(r'\[\d+\]', '', text)
+        text = _CITATION_NUMBER_RE.sub('', text)
         
         # Remove (source: ...), (ref: ...), etc.
-        text = re.sub(r'\([Ss]ource:.*?\)', '', text)
-        text = re.sub(r'\([Rr]ef:.*?\)', '', text)
+        text = _CITATION_SOURCE_RE.sub('', text)
+        text = _CITATION_REF_RE.sub('', text)
         
         return text
     
@@ -158,6 +185,30 @@ class ResponseFormatter:
             text: Raw LLM response.
             max_sentences: Optional limit on number of sentences.
         
+        Returns:
+            str: Fully formatted response ready for TTS.
+        """
+        # Nothing to speak; skip the regex pipeline
+        if not text or not text.strip():
+            return ""
+        
+        return self._format_cached(text, max_sentences, PronunciationDict.snapshot())
+    
+    def _format_uncached(
+        self,
+        text: str,
+        max_sentences: Optional[int],
+        pronunciation_snapshot: Tuple[Tuple[str, str], ...]
+    ) -> str:
+        """
+        Run the full formatting pipeline.
+        
+        Args:
+            text: Raw LLM response.
+            max_sentences: Optional limit on number of sentences.
+            pronunciation_snapshot: Pronunciation dictionary contents; only part
+                of the cache key, so any edit to the dictionary invalidates entries.
+        
         Returns:
             str: Fully formatted response ready for TTS.
         """
@@ -190,6 +241,7 @@ def main() -> None:
         "Here are the steps:\n1. First step\n2. Second step\n3. Third step",
         "The result is 50%. That's a good score! You can reach me @ email.",
         "This is a `code example` with some **bold** and *italic* text.",
+        "See [the article](https://en.wikipedia.org/wiki/Futurama_(TV_series)) for details.",
     ]
     
     print("Response Formatter Test Cases:\n")
@@ -200,6 +252,28 @@ def main() -> None:
         formatted: str = formatter.format_full_response(response)
         print(f"Formatted: {formatted}")
         print()
+    
+    # Pathological inputs must stay linear; each should take well under a second
+    adversarial_inputs: Dict[str, str] = {
+        'blank lines': " \n" * 20000,
+        'unclosed links': "[a](b" * 16000,
+        'links with parenthesized URLs': "[a](x_(y)) " * 16000,
+        'unclosed parenthesized URLs': "[a](x_(y" * 16000,
+        'unclosed brackets': "[a" * 16000,
+        'unclosed source citations': "(source: x" * 16000,
+        'unclosed ref citations': "(ref: x" * 16000,
+        'unclosed italics': "*a" * 16000,
+        'unclosed inline code': "`a" * 16000,
+    }
+    
+    print("Adversarial Input Timings:\n")
+    
+    for name, text in adversarial_inputs.items():
+        start: float = time.perf_counter()
+        formatter.format_full_response(text)
+        elapsed: float = time.perf_counter() - start
+        status: str = "OK" if elapsed < 1.0 else "SLOW"
+        print(f"  {name}: {elapsed:.3f}s [{status}]")
 
 
 if __name__ == '__main__':
@@ -149,7 +149,7 @@ class STTHandler:
                     'end': segment.end,
                     'text': segment.text
                 })
-                logger.debug(f"Segment [{segment.start:.2f}s -> {segment.end:.2f}s]: {segment.text}")
+                logger.debug("Segment [%.2fs -> %.2fs]: %s", segment.start, segment.end, segment.text)
             
             full_text = full_text.strip()
             logger.info(f"Transcription complete: {len(full_text)} characters, {len(segment_list)} segments")
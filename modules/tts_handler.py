@@ -3,14 +3,18 @@ TTS Handler module for VoiceBox project.
 Manages Text-to-Speech using MeloTTS with singleton pattern.
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple, Iterator, TYPE_CHECKING
 from pathlib import Path
 import sys
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 from config.config import Config
 from config.logger import get_logger, suppress_library_warnings
+from modules.response_formatter import SENTENCE_SPLIT_RE
 
 # Suppress third-party library warnings
 suppress_library_warnings()
@@ -79,6 +83,10 @@ class TTSHandler:
                 self._speaker = list(self._speaker_ids.keys())[0]
                 logger.info(f"Using fallback speaker: {self._speaker}")
             
+            # Absorb the CUDA cold-start cost here instead of on the first response
+            if Config.TTS_WARMUP and self._uses_cuda():
+                self._warmup()
+            
         except ImportError as e:
             logger.error("Error importing MeloTTS", exc_info=True)
             print(f"Error importing MeloTTS: {e}")
@@ -95,6 +103,34 @@ class TTSHandler:
             traceback.print_exc()
             self._model = None
     
+    def _uses_cuda(self) -> bool:
+        """
+        Check whether the loaded model runs on a CUDA device.
+        
+        Returns:
+            bool: True if the model is on CUDA.
+        """
+        device = getattr(self._model, 'device', self._device)
+        return str(device).startswith('cuda')
+    
+    def _warmup(self) -> None:
+        """
+        Run a short throwaway synthesis on CUDA.
+        Loads kernels and initializes the CUDA context at startup, so the
+        first real response doesn't pay that cost.
+        """
+        try:
+            logger.info("Warming up TTS model on CUDA")
+            self._model.tts_to_file(
+                text="Warm up.",
+                speaker_id=self._speaker_ids[self._speaker],
+                output_path=None,
+                speed=self._speed
+            )
+            logger.info("TTS warm-up complete")
+        except Exception as e:
+            logger.warning(f"TTS warm-up failed: {e}")
+    
     def text_to_speech(
         self,
         text: str,
@@ -159,6 +195,93 @@ class TTSHandler:
             traceback.print_exc()
             return False
     
+    def synthesize_to_array(
+        self,
+        text: str,
+        speaker: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> Optional[Tuple['np.ndarray', int]]:
+        """
+        Convert text to speech in memory, without writing a WAV file.
+        
+        Args:
+            text: The text to convert to speech.
+            speaker: Optional speaker override (e.g., 'EN-US', 'EN-BR').
+            speed: Optional speed override.
+        
+        Returns:
+            Optional[Tuple[np.ndarray, int]]: Audio samples and sample rate, or None if failed.
+        """
+        if self._model is None:
+            logger.error("TTS model not initialized")
+            return None
+        
+        if not text or not text.strip():
+            logger.error("Empty text provided for TTS")
+            return None
+        
+        try:
+            speaker_to_use: str = speaker or self._speaker
+            speed_to_use: float = speed or self._speed
+            
+            if speaker_to_use not in self._speaker_ids:
+                logger.error(f"Speaker '{speaker_to_use}' not found")
+                return None
+            
+            logger.info(f"Generating speech in memory (speaker={speaker_to_use}, speed={speed_to_use}, length={len(text)} chars)")
+            
+            # MeloTTS returns the waveform instead of writing it when no path is given
+            audio = self._model.tts_to_file(
+                text=text,
+                speaker_id=self._speaker_ids[speaker_to_use],
+                output_path=None,
+                speed=speed_to_use
+            )
+            sample_rate: int = self._model.hps.data.sampling_rate
+            
+            return audio, sample_rate
+            
+        except Exception as e:
+            logger.error("Error generating speech", exc_info=True)
+            return None
+    
+    def synthesize_stream(
+        self,
+        text: str,
+        speaker: Optional[str] = None,
+        speed: Optional[float] = None
+    ) -> Iterator[Tuple['np.ndarray', int]]:
+        """
+        Convert text to speech one sentence at a time.
+        Playback of the first sentence can start while later ones are synthesized.
+        
+        Args:
+            text: The text to convert to speech.
+            speaker: Optional speaker override (e.g., 'EN-US', 'EN-BR').
+            speed: Optional speed override.
+        
+        Yields:
+            Tuple[np.ndarray, int]: Audio samples and sample rate for each sentence.
+        """
+        if self._model is None:
+            logger.error("TTS model not initialized")
+            return
+        
+        if not text or not text.strip():
+            logger.error("Empty text provided for TTS")
+            return
+        
+        for sentence in SENTENCE_SPLIT_RE.split(text.strip()):
+            if not sentence.strip():
+                continue
+            
+            result = self.synthesize_to_array(sentence, speaker, speed)
+            if result is None:
+                logger.warning(f"Skipping sentence that failed to synthesize: {sentence[:50]}")
+                continue
+            
+            yield result
+    
     def generate_and_save(
         self,
         text: str,
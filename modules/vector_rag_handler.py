@@ -3,23 +3,36 @@ Vector RAG Handler module for VoiceBox project.
 Implements semantic search using embeddings and FAISS for Futuruma event information.
 """
 
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
 from pathlib import Path
+import functools
+import math
 import sys
 import re
 import pickle
-import numpy as np
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 from config.config import Config
 from config.logger import get_logger, suppress_library_warnings
+from modules.response_formatter import SENTENCE_SPLIT_RE
 
 # Suppress third-party library warnings
 suppress_library_warnings()
 
 logger = get_logger('vector_rag')
 
+# Keywords that mark a query as Futuruma-related, matched in a single regex pass
+FUTURUMA_KEYWORDS: List[str] = [
+    'futuruma', 'future-rama', 'event', 'tech fest', 'nepal', 'project',
+    'robotics', 'ai', 'cybersecurity', 'venue', 'ing skill academy',
+    'skill museum', 'smarc', 'dermascan', 'laser tag', 'showcase'
+]
+_FUTURUMA_RE = re.compile('|'.join(map(re.escape, FUTURUMA_KEYWORDS)), re.IGNORECASE)
+
 
 class VectorRAGHandler:
     """
@@ -51,8 +64,8 @@ class VectorRAGHandler:
         
         self._source_file = source_file
         self._chunks: List[str] = []
-        self._chunk_metadata: List[Dict[str, Any]] = []
-        self._embeddings: Optional[np.ndarray] = None
+        self._chunks_formatted: List[str] = []
+        self._embeddings: Optional['np.ndarray'] = None
         self._index = None
         self._embedding_model = None
         self._initialized = True
@@ -64,6 +77,11 @@ class VectorRAGHandler:
         self._chunk_overlap = Config.RAG_CHUNK_OVERLAP
         self._max_context_length = Config.RAG_MAX_CONTEXT_LENGTH
         
+        # Per-instance LRU cache so repeated queries skip the transformer forward pass
+        self._encode_query = functools.lru_cache(maxsize=Config.RAG_QUERY_CACHE_SIZE)(
+            self._encode_query_uncached
+        )
+        
         # Initialize the system
         self._init_embedding_model()
         self._load_and_process_document()
@@ -103,9 +121,15 @@ class VectorRAGHandler:
             logger.info(f"Loaded document from {self._source_file} ({len(full_text)} chars)")
             
             # Semantic chunking
-            self._chunks, self._chunk_metadata = self._semantic_chunking(full_text)
+            self._chunks, sections = self._semantic_chunking(full_text)
             logger.info(f"Created {len(self._chunks)} semantic chunks")
             
+            # Pre-format "[section] text" once so queries only index into this list
+            self._chunks_formatted = [
+                f"[{section}] {chunk}"
+                for chunk, section in zip(self._chunks, sections)
+            ]
+            
             # Generate embeddings
             self._embeddings = self._generate_embeddings(self._chunks)
             logger.info(f"Generated embeddings (shape={self._embeddings.shape})")
@@ -117,7 +141,7 @@ class VectorRAGHandler:
         except Exception as e:
             logger.error(f"Error processing document: {e}", exc_info=True)
     
-    def _semantic_chunking(self, text: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+    def _semantic_chunking(self, text: str) -> Tuple[List[str], List[str]]:
         """
         Chunk document semantically based on structure and sentences.
         
@@ -125,10 +149,10 @@ class VectorRAGHandler:
             text: Full document text.
         
         Returns:
-            Tuple of chunks and their metadata.
+            Tuple of chunks and the section title of each chunk.
         """
         chunks = []
-        metadata = []
+        chunk_sections = []
         
         # Split by major sections (headers)
         sections = re.split(r'\n(?=#+\s)', text)
@@ -141,56 +165,60 @@ class VectorRAGHandler:
             header_match = re.match(r'(#+)\s+(.+)', section)
             section_title = header_match.group(2) if header_match else "Introduction"
             
-            # Split section into sentences
-            sentences = re.split(r'(?<=[.!?])\s+', section)
-            
-            current_chunk = ""
-            current_sentences = []
+            # Split section into non-empty sentences
+            sentences = [
+                sentence.strip()
+                for sentence in SENTENCE_SPLIT_RE.split(section)
+                if sentence.strip()
+            ]
             
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if not sentence:
-                    continue
+            # Decide boundaries on lengths alone, then join each chunk once
+            lengths = [len(sentence) for sentence in sentences]
+            for chunk_start, chunk_end in self._chunk_boundaries(lengths):
+                chunks.append(" ".join(sentences[chunk_start:chunk_end]))
+                chunk_sections.append(section_title)
+        
+        return chunks, chunk_sections
+    
+    def _chunk_boundaries(self, lengths: List[int]) -> List[Tuple[int, int]]:
+        """
+        Compute chunk boundaries from sentence lengths.
+        
+        Args:
+            lengths: Character length of each sentence in a section.
+        
+        Returns:
+            List of (start, end) sentence index ranges, end exclusive.
+        """
+        boundaries = []
+        start = 0
+        current_length = 0  # Length of the sentences in [start, end) joined by spaces
+        
+        for end, length in enumerate(lengths):
+            # Check if adding sentence exceeds chunk size
+            if current_length and current_length + length > self._chunk_size:
+                boundaries.append((start, end))
                 
-                # Check if adding sentence exceeds chunk size
-                if len(current_chunk) + len(sentence) > self._chunk_size and current_chunk:
-                    # Save current chunk
-                    chunks.append(current_chunk.strip())
-                    metadata.append({
-                        'section': section_title,
-                        'chunk_index': len(chunks),
-                        'sentences': current_sentences.copy()
-                    })
-                    
-                    # Start new chunk with overlap
-                    if self._chunk_overlap > 0 and current_sentences:
-                        # Keep last sentence for overlap
-                        overlap_text = current_sentences[-1]
-                        current_chunk = overlap_text + " " + sentence
-                        current_sentences = [current_sentences[-1], sentence]
-                    else:
-                        current_chunk = sentence
-                        current_sentences = [sentence]
+                # Start new chunk with overlap
+                if self._chunk_overlap > 0:
+                    # Keep last sentence for overlap
+                    start = end - 1
+                    current_length = lengths[start] + 1 + length
                 else:
-                    # Add to current chunk
-                    if current_chunk:
-                        current_chunk += " " + sentence
-                    else:
-                        current_chunk = sentence
-                    current_sentences.append(sentence)
-            
-            # Add remaining chunk
-            if current_chunk.strip():
-                chunks.append(current_chunk.strip())
-                metadata.append({
-                    'section': section_title,
-                    'chunk_index': len(chunks),
-                    'sentences': current_sentences.copy()
-                })
-        
-        return chunks, metadata
+                    start = end
+                    current_length = length
+            elif current_length:
+                current_length += 1 + length
+            else:
+                current_length = length
+        
+        # Add remaining chunk
+        if current_length:
+            boundaries.append((start, len(lengths)))
+        
+        return boundaries
     
-    def _generate_embeddings(self, texts: List[str]) -> np.ndarray:
+    def _generate_embeddings(self, texts: List[str]) -> 'np.ndarray':
         """
         Generate embeddings for text chunks.
         
@@ -200,6 +228,8 @@ class VectorRAGHandler:
         Returns:
             Numpy array of embeddings.
         """
+        import numpy as np
+        
         if self._embedding_model is None:
             return np.array([])
         
@@ -226,19 +256,27 @@ class VectorRAGHandler:
         try:
             import faiss
             
-            dimension = self._embeddings.shape[1]
+            num_vectors, dimension = self._embeddings.shape
             logger.debug(f"Building FAISS index with dimension={dimension}")
             
-            if Config.RAG_FAISS_INDEX_TYPE.lower() == "flat":
-                # Flat index for exact search (cosine similarity via inner product on normalized vectors)
-                self._index = faiss.IndexFlatIP(dimension)
+            # No copy when already float32
+            embeddings = self._embeddings.astype('float32', copy=False)
+            
+            if Config.RAG_FAISS_INDEX_TYPE.lower() == "ivf" and num_vectors >= Config.RAG_IVF_MIN_VECTORS:
+                # Inverted file index: each query only scans the nprobe nearest clusters
+                nlist = int(4 * math.sqrt(num_vectors))
+                quantizer = faiss.IndexFlatIP(dimension)
+                self._index = faiss.IndexIVFFlat(quantizer, dimension, nlist, faiss.METRIC_INNER_PRODUCT)
+                self._index.train(embeddings)
+                self._index.nprobe = Config.RAG_IVF_NPROBE
+                logger.debug(f"Using IVF index (nlist={nlist}, nprobe={Config.RAG_IVF_NPROBE})")
             else:
-                # Default to Flat
+                # Flat index for exact search (cosine similarity via inner product on normalized vectors)
                 self._index = faiss.IndexFlatIP(dimension)
             
             # Add vectors to index
-            self._index.add(self._embeddings.astype('float32'))
-            logger.info(f"FAISS index built successfully with {self._embeddings.shape[0]} vectors")
+            self._index.add(embeddings)
+            logger.info(f"FAISS index built successfully with {self._index.ntotal} vectors (dim={self._index.d})")
             
         except ImportError as e:
             logger.error("faiss not installed", exc_info=True)
@@ -247,6 +285,28 @@ class VectorRAGHandler:
         except Exception as e:
             logger.error(f"Error building FAISS index: {e}", exc_info=True)
             self._index = None
+        
+        # FAISS keeps its own copy of the vectors; don't hold a second one
+        self._embeddings = None
+    
+    def _encode_query_uncached(self, query: str) -> bytes:
+        """
+        Encode a single query into its normalized embedding.
+        
+        Args:
+            query: User's query.
+        
+        Returns:
+            Raw float32 bytes of the embedding (immutable, safe to cache).
+        """
+        import numpy as np
+        
+        query_embedding = self._embedding_model.encode(
+            [query],
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        return np.ascontiguousarray(query_embedding, dtype=np.float32).tobytes()
     
     def search_context(self, query: str, max_chunks: Optional[int] = None) -> str:
         """
@@ -270,21 +330,22 @@ class VectorRAGHandler:
             return ""
         
         try:
-            # Generate query embedding
-            query_embedding = self._embedding_model.encode(
-                [query],
-                convert_to_numpy=True,
-                normalize_embeddings=True
-            )
+            import numpy as np
+            
+            # Generate query embedding (cached by query string)
+            query_embedding = np.frombuffer(
+                self._encode_query(query),
+                dtype='float32'
+            ).reshape(1, -1)
             
             # Search in FAISS index
             scores, indices = self._index.search(
-                query_embedding.astype('float32'),
+                np.ascontiguousarray(query_embedding, dtype=np.float32),
                 max_chunks
             )
             
-            # Filter by score threshold and collect chunks
-            relevant_chunks = []
+            # Filter by score threshold and collect pre-formatted chunks
+            context_parts: List[str] = []
             current_length = 0
             
             for score, idx in zip(scores[0], indices[0]):
@@ -292,28 +353,18 @@ class VectorRAGHandler:
                 if score < self._score_threshold:
                     continue
                 
-                chunk_text = self._chunks[idx]
-                chunk_meta = self._chunk_metadata[idx]
+                chunk_text = self._chunks_formatted[idx]
                 
                 # Check context length limit
                 if current_length + len(chunk_text) <= self._max_context_length:
-                    relevant_chunks.append({
-                        'text': chunk_text,
-                        'score': float(score),
-                        'section': chunk_meta['section']
-                    })
+                    context_parts.append(chunk_text)
                     current_length += len(chunk_text)
                 else:
                     break
             
-            if not relevant_chunks:
+            if not context_parts:
                 return ""
             
-            # Format context
-            context_parts = []
-            for chunk in relevant_chunks:
-                context_parts.append(f"[{chunk['section']}] {chunk['text']}")
-            
             return "\n\n".join(context_parts)
             
         except Exception as e:
@@ -322,15 +373,7 @@ class VectorRAGHandler:
     
     def is_futuruma_related(self, query: str) -> bool:
         """Check if query is Futuruma-related."""
-        query_lower = query.lower()
-        
-        keywords = [
-            'futuruma', 'future-rama', 'event', 'tech fest', 'nepal', 'project',
-            'robotics', 'ai', 'cybersecurity', 'venue', 'ing skill academy',
-            'skill museum', 'smarc', 'dermascan', 'laser tag', 'showcase'
-        ]
-        
-        return any(keyword in query_lower for keyword in keywords)
+        return bool(_FUTURUMA_RE.search(query))
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get RAG system statistics."""